@@ -28,7 +28,7 @@ from plotpy.panels.csection.csitem import compute_line_section as csline
 from skimage import filters
 
 import cdl.algorithms.image as alg
-from cdl.algorithms.datatypes import clip_astype, is_integer_dtype
+from cdl.algorithms.datatypes import clip_astype, is_complex_dtype, is_integer_dtype
 from cdl.computation.base import (
     ArithmeticParam,
     ClipParam,
@@ -190,6 +190,62 @@ def compute_product(dst: ImageObj, src: ImageObj) -> ImageObj:
     return dst
 
 
+def __reduce_n1(ufunc: np.ufunc, dst: ImageObj, src_list: list[ImageObj]) -> ImageObj:
+    """Reduce **src_list** images into **dst** image with a NumPy binary ufunc,
+    accumulating in place (no intermediate array is allocated)
+
+    Args:
+        ufunc: NumPy binary ufunc (e.g. :py:data:`numpy.add`)
+        dst: output image object
+        src_list: list of input image objects
+
+    Returns:
+        Output image object (modified in place)
+    """
+    if not is_complex_dtype(dst.data.dtype):
+        dst.data = np.asarray(dst.data, dtype=float)
+    for src in src_list:
+        ufunc(dst.data, src.data, out=dst.data)
+        restore_data_outside_roi(dst, src)
+    return dst
+
+
+def compute_addition_n1(dst: ImageObj, src_list: list[ImageObj]) -> ImageObj:
+    """Add all **src_list** images to **dst** image in a single call, and return
+    **dst** image modified in place
+
+    This is equivalent to calling :py:func:`compute_addition` for each source
+    image, except that the sum is accumulated in place in a single function call
+    (i.e. in a single task when process isolation is enabled).
+
+    Args:
+        dst: output image object
+        src_list: list of input image objects
+
+    Returns:
+        Output image object (modified in place)
+    """
+    return __reduce_n1(np.add, dst, src_list)
+
+
+def compute_product_n1(dst: ImageObj, src_list: list[ImageObj]) -> ImageObj:
+    """Multiply **dst** image by all **src_list** images in a single call, and
+    return **dst** image modified in place
+
+    This is equivalent to calling :py:func:`compute_product` for each source
+    image, except that the product is accumulated in place in a single function
+    call (i.e. in a single task when process isolation is enabled).
+
+    Args:
+        dst: output image object
+        src_list: list of input image objects
+
+    Returns:
+        Output image object (modified in place)
+    """
+    return __reduce_n1(np.multiply, dst, src_list)
+
+
 def compute_addition_constant(src: ImageObj, p: ConstantParam) -> ImageObj:
     """Add **dst** and a constant value and return the new result image object
 
@@ -166,6 +166,46 @@ def compute_product(dst: SignalObj, src: SignalObj) -> SignalObj:
     return dst
 
 
+def compute_addition_n1(dst: SignalObj, src_list: list[SignalObj]) -> SignalObj:
+    """Add all **src_list** signals to **dst** signal in a single call, and return
+    **dst** signal modified in place
+
+    This is equivalent to calling :py:func:`compute_addition` for each source
+    signal, except that the whole reduction is done in a single function call
+    (i.e. in a single task when process isolation is enabled).
+
+    Args:
+        dst: destination signal
+        src_list: list of source signals
+
+    Returns:
+        Modified **dst** signal (modified in place)
+    """
+    for src in src_list:
+        compute_addition(dst, src)
+    return dst
+
+
+def compute_product_n1(dst: SignalObj, src_list: list[SignalObj]) -> SignalObj:
+    """Multiply **dst** signal by all **src_list** signals in a single call, and
+    return **dst** signal modified in place
+
+    This is equivalent to calling :py:func:`compute_product` for each source
+    signal, except that the whole reduction is done in a single function call
+    (i.e. in a single task when process isolation is enabled).
+
+    Args:
+        dst: destination signal
+        src_list: list of source signals
+
+    Returns:
+        Modified **dst** signal (modified in place)
+    """
+    for src in src_list:
+        compute_product(dst, src)
+    return dst
+
+
 def compute_addition_constant(src: SignalObj, p: ConstantParam) -> SignalObj:
     """Add **dst** and a constant value and return a the new result signal object
 
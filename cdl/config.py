@@ -96,6 +96,9 @@ class MainSection(conf.Section, metaclass=conf.SectionMeta):
 
     color_mode = conf.EnumOption(["auto", "dark", "light"], default="auto")
     process_isolation_enabled = conf.Option()
+    # Number of worker processes used when process isolation is enabled
+    # (0: automatic, i.e. one process per CPU core)
+    process_pool_size = conf.Option()
     rpc_server_enabled = conf.Option()
     rpc_server_port = conf.Option()
     traceback_log_path = conf.ConfigPathOption()
@@ -290,6 +293,7 @@ def initialize():
     # Main section
     Conf.main.color_mode.get("auto")
     Conf.main.process_isolation_enabled.get(True)
+    Conf.main.process_pool_size.get(0)
     Conf.main.rpc_server_enabled.get(True)
     Conf.main.traceback_log_path.get(f".{APP_NAME}_traceback.log")
     Conf.main.faulthandler_log_path.get(f".{APP_NAME}_faulthandler.log")
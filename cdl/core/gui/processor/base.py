@@ -9,10 +9,11 @@
 from __future__ import annotations
 
 import abc
+import functools
 import multiprocessing
-import time
+import os
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Generator
 from multiprocessing.pool import Pool
 from typing import TYPE_CHECKING, Any, Generic, Union
 
@@ -28,12 +29,19 @@ from cdl import env
 from cdl.algorithms.datatypes import is_complex_dtype
 from cdl.config import Conf, _
 from cdl.core.gui.processor.catcher import CompOut, wng_err_func
+from cdl.core.gui.processor.transport import (
+    export_args,
+    import_result,
+    release_shared_memory,
+    shm_wng_err_func,
+)
 from cdl.core.model.base import ResultProperties, ResultShape, TypeROI
 from cdl.utils.qthelpers import create_progress_bar, qt_try_except
 from cdl.widgets.warningerror import show_warning_error
 
 if TYPE_CHECKING:
     from multiprocessing.pool import AsyncResult
+    from multiprocessing.shared_memory import SharedMemory
 
     from plotpy.plot import PlotWidget
 
@@ -80,19 +88,44 @@ COMPUTATION_TIP = _(
 POOL: Pool | None = None
 
 
-class Worker:
-    """Multiprocessing worker, to run long-running tasks in a separate process"""
+def get_pool_size() -> int:
+    """Return the number of worker processes of the multiprocessing pool.
+
+    Returns:
+        Number of processes (from configuration, or number of CPU cores if the
+        configured value is 0)
+    """
+    size = Conf.main.process_pool_size.get(0)
+    if not size:
+        size = os.cpu_count() or 1
+    return max(1, int(size))
+
+
+class Worker(QC.QObject):
+    """Multiprocessing worker, to run long-running tasks in a separate process
+
+    Results are collected through the pool's completion callbacks, which are
+    bridged to the GUI thread with a Qt signal: waiting for a result does not
+    involve any polling (see :py:meth:`wait_for_result`)."""
+
+    SIG_COMPUTATION_FINISHED = QC.Signal()
 
     def __init__(self) -> None:
-        self.asyncresult: AsyncResult = None
+        super().__init__()
+        self.asyncresults: list[AsyncResult] = []
+        self.results: dict[int, CompOut | BaseException] = {}
+        self.shms: dict[int, list[SharedMemory]] = {}
         self.result: Any = None
+        self.__loop: QC.QEventLoop | None = None
+        self.SIG_COMPUTATION_FINISHED.connect(self.__computation_finished)
 
     @staticmethod
     def create_pool() -> None:
-        """Create multiprocessing pool"""
+        """Create multiprocessing pool (if not already created)"""
         global POOL  # pylint: disable=global-statement
-        # Create a pool with one process
-        POOL = Pool(processes=1)  # pylint: disable=not-callable,consider-using-with
+        if POOL is None:
+            # pylint: disable=not-callable,consider-using-with
+            POOL = Pool(processes=get_pool_size())
 
     @staticmethod
     def terminate_pool(wait: bool = False) -> None:
@@ -116,9 +149,35 @@ class Worker:
         """Terminate and recreate the pool"""
         # Terminate the process and stop the timer
         self.terminate_pool(wait=False)
+        self.asyncresults = []
+        self.results = {}
+        self.release_shared_memory()
         # Recreate the pool for the next computation
         self.create_pool()
 
+    def __store_result(self, index: int, result: CompOut | BaseException) -> None:
+        """Store computation result (or exception) and notify the GUI thread.
+
+        .. note::
+
+            This method is called from the pool's result handler thread.
+
+        Args:
+            index: index of the task in the current batch
+            result: computation result, or exception raised by the task
+        """
+        # Input data is no longer needed by the worker: destroy shared memory blocks
+        release_shared_memory(self.shms.pop(index, []), unlink=True)
+        if isinstance(result, CompOut):
+            result = import_result(result)
+        self.results[index] = result
+        self.SIG_COMPUTATION_FINISHED.emit()
+
+    def __computation_finished(self) -> None:
+        """A computation has finished: stop waiting (GUI thread)"""
+        if self.__loop is not None:
+            self.__loop.quit()
+
     def run(self, func: Callable, args: tuple[Any]) -> None:
         """Run computation.
 
@@ -126,9 +185,37 @@ class Worker:
             func: function to run
             args: arguments
         """
+        self.run_batch([(func, args)])
+
+    def run_batch(self, tasks: list[tuple[Callable, tuple[Any]]]) -> None:
+        """Run a batch of computations, distributed over all pool processes.
+
+        Args:
+            tasks: list of (function, arguments) tuples
+        """
         global POOL  # pylint: disable=global-statement,global-variable-not-assigned
         assert POOL is not None
-        self.asyncresult = POOL.apply_async(wng_err_func, (func, args))
+        self.results = {}
+        self.asyncresults = []
+        self.release_shared_memory()
+        for index, (func, args) in enumerate(tasks):
+            # Large data arrays are transported through shared memory
+            args, self.shms[index] = export_args(args)
+            callback = functools.partial(self.__store_result, index)
+            self.asyncresults.append(
+                POOL.apply_async(
+                    shm_wng_err_func,
+                    (func, args),
+                    callback=callback,
+                    error_callback=callback,
+                )
+            )
+
+    def release_shared_memory(self) -> None:
+        """Destroy all shared memory blocks created for the current batch"""
+        for shms in self.shms.values():
+            release_shared_memory(shms, unlink=True)
+        self.shms = {}
 
     def close(self) -> None:
         """Close worker: close pool properly and wait for all tasks to finish"""
@@ -136,24 +223,59 @@ class Worker:
         # to avoid blocking the GUI at exit (so, when wait=True, we wait for the
         # task to finish before closing the pool but there is actually no task running,
         # so the pool is closed immediately but *properly*)
-        self.terminate_pool(wait=self.asyncresult is None)
+        self.terminate_pool(wait=all(res.ready() for res in self.asyncresults))
+        self.release_shared_memory()
 
-    def is_computation_finished(self) -> bool:
+    def is_computation_finished(self, index: int = 0) -> bool:
         """Return True if computation is finished.
 
+        Args:
+            index: index of the task in the current batch. Defaults to 0.
+
         Returns:
             bool: True if computation is finished
         """
-        return self.asyncresult.ready()
+        return index in self.results
+
+    def wait_for_result(self, index: int, progress: QW.QProgressDialog) -> bool:
+        """Wait for a computation to finish, while keeping the GUI responsive.
 
-    def get_result(self) -> CompOut:
+        The local event loop is stopped as soon as the result is available (no
+        polling) or when the progress dialog is canceled.
+
+        Args:
+            index: index of the task in the current batch
+            progress: progress dialog
+
+        Returns:
+            True if computation is finished, False if it has been canceled
+        """
+        while not self.is_computation_finished(index):
+            if progress.wasCanceled():
+                return False
+            loop = QC.QEventLoop()
+            progress.canceled.connect(loop.quit)
+            self.__loop = loop
+            try:
+                loop.exec()
+            finally:
+                self.__loop = None
+                progress.canceled.disconnect(loop.quit)
+        return True
+
+    def get_result(self, index: int = 0) -> CompOut:
         """Return computation result.
 
+        Args:
+            index: index of the task in the current batch. Defaults to 0.
+
         Returns:
             CompOut: computation result
         """
-        self.result = self.asyncresult.get()
-        self.asyncresult = None
+        result = self.results.pop(index)
+        if isinstance(result, BaseException):
+            raise result
+        self.result = result
         return self.result
 
 
@@ -358,16 +480,49 @@ class BaseProcessor(QC.QObject, Generic[TypeROI]):
             if self.worker is None:
                 return wng_err_func(func, args)
             self.worker.run(func, args)
-            while not self.worker.is_computation_finished():
-                QW.QApplication.processEvents()
-                time.sleep(0.1)
-                if progress.wasCanceled():
-                    self.worker.restart_pool()
-                    break
-            if self.worker.is_computation_finished():
+            if self.worker.wait_for_result(0, progress):
                 return self.worker.get_result()
+            self.worker.restart_pool()
         return None
 
+    def __exec_funcs(
+        self,
+        tasks: list[tuple[Callable, tuple]],
+        progress: QW.QProgressDialog,
+    ) -> Generator[CompOut | None, None, None]:
+        """Execute functions, eventually in parallel in separate processes.
+
+        All tasks are submitted at once to the worker pool, and results are
+        yielded in the same order as the tasks.
+
+        Args:
+            tasks: list of (function, arguments) tuples
+            progress: progress dialog
+
+        Yields:
+            Computation output object, or None if canceled (in that case, the
+            generator stops)
+        """
+        QW.QApplication.processEvents()
+        if self.worker is None:
+            for func, args in tasks:
+                QW.QApplication.processEvents()
+                if progress.wasCanceled():
+                    yield None
+                    return
+                yield wng_err_func(func, args)
+            return
+        if progress.wasCanceled():
+            yield None
+            return
+        self.worker.run_batch(tasks)
+        for index in range(len(tasks)):
+            if not self.worker.wait_for_result(index, progress):
+                self.worker.restart_pool()
+                yield None
+                return
+            yield self.worker.get_result(index)
+
     def _compute_11_subroutine(
         self, funcs: list[Callable], params: list, title: str
     ) -> None:
@@ -382,47 +537,50 @@ class BaseProcessor(QC.QObject, Generic[TypeROI]):
         objs = self.panel.objview.get_sel_objects(include_groups=True)
         grps = self.panel.objview.get_sel_groups()
         new_gids = {}
-        with create_progress_bar(
-            self.panel, title, max_=len(objs) * len(params)
-        ) as progress:
-            for i_row, obj in enumerate(objs):
-                for i_param, (param, func) in enumerate(zip(params, funcs)):
-                    name = func.__name__.replace("compute_", "")
-                    i_title = f"{title} ({i_row + 1}/{len(objs)})"
-                    progress.setLabelText(i_title)
-                    pvalue = (i_row + 1) * (i_param + 1)
-                    pvalue = 0 if pvalue == 1 else pvalue
-                    progress.setValue(pvalue)
-                    args = (obj,) if param is None else (obj, param)
-                    result = self.__exec_func(func, args, progress)
-                    if result is None:
-                        break
-                    new_obj = self.handle_output(
-                        result, _("Computing: %s") % i_title, progress
-                    )
-                    if new_obj is None:
-                        continue
+        # Computations are submitted all at once (so that they may run in parallel
+        # in the worker pool), and results are handled in the selection order
+        tasks, contexts = [], []
+        for i_row, obj in enumerate(objs):
+            for param, func in zip(params, funcs):
+                args = (obj,) if param is None else (obj, param)
+                tasks.append((func, args))
+                contexts.append((obj, func, f"{title} ({i_row + 1}/{len(objs)})"))
+        with create_progress_bar(self.panel, title, max_=len(tasks)) as progress:
+            results = self.__exec_funcs(tasks, progress)
+            for index, (result, (obj, func, i_title)) in enumerate(
+                zip(results, contexts)
+            ):
+                if result is None:
+                    break
+                name = func.__name__.replace("compute_", "")
+                progress.setLabelText(i_title)
+                progress.setValue(index + 1)
+                new_obj = self.handle_output(
+                    result, _("Computing: %s") % i_title, progress
+                )
+                if new_obj is None:
+                    continue
 
-                    # Is new object a native object (i.e. a Signal object for a Signal
-                    # Panel, or an Image object for an Image Panel) ?
-                    # (example of non-native object use case: image profile extraction)
-                    is_new_obj_native = isinstance(new_obj, self.panel.PARAMCLASS)
-
-                    new_gid = None
-                    if grps and is_new_obj_native:
-                        # If groups are selected, then it means that there is no
-                        # individual object selected: we work on groups only
-                        old_gid = self.panel.objmodel.get_object_group_id(obj)
-                        new_gid = new_gids.get(old_gid)
-                        if new_gid is None:
-                            # Create a new group for each selected group
-                            old_g = self.panel.objmodel.get_group(old_gid)
-                            new_g = self.panel.add_group(f"{name}({old_g.short_id})")
-                            new_gids[old_gid] = new_gid = new_g.uuid
-                    if is_new_obj_native:
-                        self.panel.add_object(new_obj, group_id=new_gid)
-                    else:
-                        self.panel.mainwindow.add_object(new_obj)
+                # Is new object a native object (i.e. a Signal object for a Signal
+                # Panel, or an Image object for an Image Panel) ?
+                # (example of non-native object use case: image profile extraction)
+                is_new_obj_native = isinstance(new_obj, self.panel.PARAMCLASS)
+
+                new_gid = None
+                if grps and is_new_obj_native:
+                    # If groups are selected, then it means that there is no
+                    # individual object selected: we work on groups only
+                    old_gid = self.panel.objmodel.get_object_group_id(obj)
+                    new_gid = new_gids.get(old_gid)
+                    if new_gid is None:
+                        # Create a new group for each selected group
+                        old_g = self.panel.objmodel.get_group(old_gid)
+                        new_g = self.panel.add_group(f"{name}({old_g.short_id})")
+                        new_gids[old_gid] = new_gid = new_g.uuid
+                if is_new_obj_native:
+                    self.panel.add_object(new_obj, group_id=new_gid)
+                else:
+                    self.panel.mainwindow.add_object(new_obj)
         # Select newly created groups, if any
         for group_id in new_gids.values():
             self.panel.objview.set_current_item_id(group_id, extend=True)
@@ -577,6 +735,7 @@ class BaseProcessor(QC.QObject, Generic[TypeROI]):
         comment: str | None = None,
         func_objs: Callable | None = None,
         edit: bool | None = None,
+        reduce_all: bool = False,
     ) -> None:
         """Compute n1 function: N(>=2) objects in → 1 object out.
 
@@ -589,6 +748,10 @@ class BaseProcessor(QC.QObject, Generic[TypeROI]):
             comment: comment. Defaults to None.
             func_objs: function to execute on objects. Defaults to None.
             edit: if True, edit parameters. Defaults to None.
+            reduce_all: if True, `func` takes the destination object and the list
+             of all the other source objects, and is called once per destination
+             object, instead of once per source object (`func` then takes the
+             destination object and a single source object). Defaults to False.
         """
         if (edit is None or param is None) and paramclass is not None:
             edit, param = self.init_param(param, paramclass, title, comment)
@@ -596,6 +759,10 @@ class BaseProcessor(QC.QObject, Generic[TypeROI]):
             if edit and not param.edit(parent=self.panel.parent()):
                 return
 
+        if reduce_all:
+            self.__compute_n1_reduce(name, func, param, title, func_objs)
+            return
+
         objs = self.panel.objview.get_sel_objects(include_groups=True)
         objmodel = self.panel.objmodel
         pairwise = is_pairwise_mode()
@@ -621,9 +788,7 @@ class BaseProcessor(QC.QObject, Generic[TypeROI]):
                     src_obj1: SignalObj | ImageObj
                     progress.setValue(i_pair + 1)
                     progress.setLabelText(title)
-                    src_dtype = src_obj1.data.dtype
-                    dst_dtype = complex if is_complex_dtype(src_dtype) else float
-                    dst_obj = src_obj1.copy(dtype=dst_dtype)
+                    dst_obj = self.__create_n1_dst(src_obj1)
                     src_objs_pair = [src_obj1]
                     for src_gid in src_gids[1:]:
                         src_obj = src_objs[src_gid][i_pair]
@@ -641,11 +806,7 @@ class BaseProcessor(QC.QObject, Generic[TypeROI]):
                         if dst_obj is None:
                             break
                         dst_obj.update_resultshapes_from(src_obj)
-                        if src_obj.roi is not None:
-                            if dst_obj.roi is None:
-                                dst_obj.roi = src_obj.roi.copy()
-                            else:
-                                dst_obj.roi.add_roi(src_obj.roi)
+                        self.__merge_n1_roi(dst_obj, src_obj)
                     if func_objs is not None:
                         func_objs(dst_obj, src_objs_pair)
                     short_ids = [obj.short_id for obj in src_objs_pair]
@@ -690,30 +851,180 @@ class BaseProcessor(QC.QObject, Generic[TypeROI]):
                             break
                         dst_objs[src_gid] = dst_obj
                         dst_obj.update_resultshapes_from(src_obj)
-                    if src_obj.roi is not None:
-                        if dst_obj.roi is None:
-                            dst_obj.roi = src_obj.roi.copy()
-                        else:
-                            dst_obj.roi.add_roi(src_obj.roi)
-
-            grps = self.panel.objview.get_sel_groups()
-            if grps:
-                # (Group exclusive selection)
-                # At least one group is selected: create a new group
-                dst_gname = f"{name}({','.join([grp.short_id for grp in grps])})"
-                dst_gid = self.panel.add_group(dst_gname).uuid
+                    self.__merge_n1_roi(dst_obj, src_obj)
+
+            dst_gid = self.__add_n1_single_results(name, dst_objs, src_objs, func_objs)
+
+        # Select newly created group, if any
+        if dst_gid is not None:
+            self.panel.objview.set_current_item_id(dst_gid)
+
+    @staticmethod
+    def __create_n1_dst(src_obj: Obj) -> Obj:
+        """Create n1 destination object from first source object: data is converted
+        to float (or complex) to accumulate results without overflow.
+
+        Args:
+            src_obj: first source object
+
+        Returns:
+            Destination object
+        """
+        dst_dtype = complex if is_complex_dtype(src_obj.data.dtype) else float
+        return src_obj.copy(dtype=dst_dtype)
+
+    @staticmethod
+    def __merge_n1_roi(dst_obj: Obj, src_obj: Obj) -> None:
+        """Merge source object ROI into n1 destination object ROI.
+
+        Args:
+            dst_obj: destination object
+            src_obj: source object
+        """
+        if src_obj.roi is not None:
+            if dst_obj.roi is None:
+                dst_obj.roi = src_obj.roi.copy()
             else:
-                # (Object exclusive selection)
-                # No group is selected: use each object's group
-                dst_gid = None
+                dst_obj.roi.add_roi(src_obj.roi)
+
+    def __add_n1_single_results(
+        self,
+        name: str,
+        dst_objs: dict[str, Obj],
+        src_objs: dict[str, list[Obj]],
+        func_objs: Callable | None,
+    ) -> str | None:
+        """Add n1 results computed in single operand mode to the panel.
+
+        Args:
+            name: name of function
+            dst_objs: keys: source group id, values: destination object
+            src_objs: keys: source group id, values: list of source objects
+            func_objs: function to execute on objects
+
+        Returns:
+            Newly created group id, or None if results were added to the groups
+            of the source objects
+        """
+        grps = self.panel.objview.get_sel_groups()
+        if grps:
+            # (Group exclusive selection)
+            # At least one group is selected: create a new group
+            dst_gname = f"{name}({','.join([grp.short_id for grp in grps])})"
+            dst_gid = self.panel.add_group(dst_gname).uuid
+        else:
+            # (Object exclusive selection)
+            # No group is selected: use each object's group
+            dst_gid = None
+
+        for src_gid, dst_obj in dst_objs.items():
+            if func_objs is not None:
+                func_objs(dst_obj, src_objs[src_gid])
+            short_ids = [obj.short_id for obj in src_objs[src_gid]]
+            dst_obj.title = f'{name}({", ".join(short_ids)})'
+            group_id = dst_gid if dst_gid is not None else src_gid
+            self.panel.add_object(dst_obj, group_id=group_id)
+        return dst_gid
+
+    def __compute_n1_reduce(
+        self,
+        name: str,
+        func: Callable,
+        param: gds.DataSet | None,
+        title: str | None,
+        func_objs: Callable | None,
+    ) -> None:
+        """Compute n1 function with a reduction function, i.e. a function taking
+        the destination object and the list of all the other source objects (see
+        :py:meth:`compute_n1`, `reduce_all` argument).
+
+        Each destination object is computed in a single call, so that the source
+        objects are sent only once to the worker pool. Destination objects are
+        computed in parallel when process isolation is enabled.
 
-            for src_gid, dst_obj in dst_objs.items():
+        Args:
+            name: name of function
+            func: reduction function
+            param: parameters
+            title: title of progress bar
+            func_objs: function to execute on objects
+        """
+        objs = self.panel.objview.get_sel_objects(include_groups=True)
+        objmodel = self.panel.objmodel
+        pairwise = is_pairwise_mode()
+
+        # [src_lists list] lists of source objects (one list per destination object)
+        src_lists: list[list[Obj]] = []
+        if pairwise:
+            src_grps, src_gids, src_objs, nbobj, valid = (
+                self.__get_src_grps_gids_objs_nbobj_valid()
+            )
+            if not valid:
+                return
+            for i_pair in range(nbobj):
+                src_lists.append([src_objs[src_gid][i_pair] for src_gid in src_gids])
+        else:
+            # [src_objs dictionary] keys: old group id, values: list of old objects
+            src_objs: dict[str, list[Obj]] = {}
+            for src_obj in objs:
+                src_gid = objmodel.get_object_group_id(src_obj)
+                src_objs.setdefault(src_gid, []).append(src_obj)
+            src_lists = list(src_objs.values())
+
+        tasks = []
+        for src_list in src_lists:
+            dst_obj = self.__create_n1_dst(src_list[0])
+            if not pairwise:
+                dst_obj.roi = None
+            args = (dst_obj, src_list[1:])
+            tasks.append((func, args if param is None else args + (param,)))
+
+        # [dst_list list] destination objects (None if computation failed)
+        dst_list: list[Obj | None] = [None] * len(tasks)
+        with create_progress_bar(self.panel, title, max_=len(tasks)) as progress:
+            progress.setLabelText(title)
+            results = self.__exec_funcs(tasks, progress)
+            for index, (src_list, result) in enumerate(zip(src_lists, results)):
+                if result is None:
+                    break
+                progress.setValue(index + 1)
+                dst_obj = self.handle_output(
+                    result, _("Calculating: %s") % title, progress
+                )
+                if dst_obj is None:
+                    continue
+                for src_obj in src_list[1:]:
+                    dst_obj.update_resultshapes_from(src_obj)
+                # In pairwise mode, destination object already has the first
+                # source object's ROI (copied with the object)
+                for src_obj in src_list[1 if pairwise else 0 :]:
+                    self.__merge_n1_roi(dst_obj, src_obj)
+                dst_list[index] = dst_obj
+
+        if pairwise:
+            dst_gname = (
+                f"{name}({','.join([grp.short_id for grp in src_grps])})|pairwise"
+            )
+            group_exclusive = len(self.panel.objview.get_sel_groups()) != 0
+            if not group_exclusive:
+                # This is not a group exclusive selection
+                dst_gname += "[...]"
+            dst_gid = self.panel.add_group(dst_gname).uuid
+            for src_list, dst_obj in zip(src_lists, dst_list):
+                if dst_obj is None:
+                    continue
                 if func_objs is not None:
-                    func_objs(dst_obj, src_objs[src_gid])
-                short_ids = [obj.short_id for obj in src_objs[src_gid]]
+                    func_objs(dst_obj, src_list)
+                short_ids = [obj.short_id for obj in src_list]
                 dst_obj.title = f'{name}({", ".join(short_ids)})'
-                group_id = dst_gid if dst_gid is not None else src_gid
-                self.panel.add_object(dst_obj, group_id=group_id)
+                self.panel.add_object(dst_obj, group_id=dst_gid)
+        else:
+            dst_objs = {
+                src_gid: dst_obj
+                for src_gid, dst_obj in zip(src_objs, dst_list)
+                if dst_obj is not None
+            }
+            dst_gid = self.__add_n1_single_results(name, dst_objs, src_objs, func_objs)
 
         # Select newly created group, if any
         if dst_gid is not None:
@@ -54,8 +54,10 @@ class ImageProcessor(BaseProcessor[ImageROI]):
 
     @qt_try_except()
     def compute_sum(self) -> None:
-        """Compute sum with :py:func:`cdl.computation.image.compute_addition`"""
-        self.compute_n1("Σ", cpi.compute_addition, title=_("Sum"))
+        """Compute sum with :py:func:`cdl.computation.image.compute_addition_n1`"""
+        self.compute_n1(
+            "Σ", cpi.compute_addition_n1, title=_("Sum"), reduce_all=True
+        )
 
     @qt_try_except()
     def compute_addition_constant(self, param: cpb.ConstantParam | None = None) -> None:
@@ -70,7 +72,7 @@ class ImageProcessor(BaseProcessor[ImageROI]):
 
     @qt_try_except()
     def compute_average(self) -> None:
-        """Compute average with :py:func:`cdl.computation.image.compute_addition`
+        """Compute average with :py:func:`cdl.computation.image.compute_addition_n1`
         and dividing by the number of images"""
 
         def func_objs(new_obj: ImageObj, old_objs: list[ImageObj]) -> None:
@@ -78,13 +80,19 @@ class ImageProcessor(BaseProcessor[ImageROI]):
             new_obj.data = new_obj.data / float(len(old_objs))
 
         self.compute_n1(
-            "μ", cpi.compute_addition, func_objs=func_objs, title=_("Average")
+            "μ",
+            cpi.compute_addition_n1,
+            func_objs=func_objs,
+            title=_("Average"),
+            reduce_all=True,
         )
 
     @qt_try_except()
     def compute_product(self) -> None:
-        """Compute product with :py:func:`cdl.computation.image.compute_product`"""
-        self.compute_n1("Π", cpi.compute_product, title=_("Product"))
+        """Compute product with :py:func:`cdl.computation.image.compute_product_n1`"""
+        self.compute_n1(
+            "Π", cpi.compute_product_n1, title=_("Product"), reduce_all=True
+        )
 
     @qt_try_except()
     def compute_product_constant(self, param: cpb.ConstantParam | None = None) -> None:
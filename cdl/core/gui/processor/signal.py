@@ -33,8 +33,10 @@ class SignalProcessor(BaseProcessor[SignalROI]):
 
     @qt_try_except()
     def compute_sum(self) -> None:
-        """Compute sum with :py:func:`cdl.computation.signal.compute_addition`"""
-        self.compute_n1("Σ", cps.compute_addition, title=_("Sum"))
+        """Compute sum with :py:func:`cdl.computation.signal.compute_addition_n1`"""
+        self.compute_n1(
+            "Σ", cps.compute_addition_n1, title=_("Sum"), reduce_all=True
+        )
 
     @qt_try_except()
     def compute_addition_constant(self, param: cpb.ConstantParam | None = None) -> None:
@@ -49,7 +51,7 @@ class SignalProcessor(BaseProcessor[SignalROI]):
 
     @qt_try_except()
     def compute_average(self) -> None:
-        """Compute average with :py:func:`cdl.computation.signal.compute_addition`
+        """Compute average with :py:func:`cdl.computation.signal.compute_addition_n1`
         and divide by the number of signals"""
 
         def func_objs(new_obj: SignalObj, old_objs: list[SignalObj]) -> None:
@@ -59,13 +61,19 @@ class SignalProcessor(BaseProcessor[SignalROI]):
                 new_obj.dy = new_obj.dy / float(len(old_objs))
 
         self.compute_n1(
-            "μ", cps.compute_addition, func_objs=func_objs, title=_("Average")
+            "μ",
+            cps.compute_addition_n1,
+            func_objs=func_objs,
+            title=_("Average"),
+            reduce_all=True,
         )
 
     @qt_try_except()
     def compute_product(self) -> None:
-        """Compute product with :py:func:`cdl.computation.signal.compute_product`"""
-        self.compute_n1("Π", cps.compute_product, title=_("Product"))
+        """Compute product with :py:func:`cdl.computation.signal.compute_product_n1`"""
+        self.compute_n1(
+            "Π", cps.compute_product_n1, title=_("Product"), reduce_all=True
+        )
 
     @qt_try_except()
     def compute_product_constant(self, param: cpb.ConstantParam | None = None) -> None:
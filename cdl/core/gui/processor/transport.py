@@ -0,0 +1,247 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+DataLab shared memory transport for processors
+
+When process isolation is enabled, signal and image objects are sent to the
+worker processes (and results are sent back) through the pool's pipes, which
+means that their data arrays are pickled and copied several times. This module
+moves large arrays to shared memory blocks instead: only the object's metadata
+and the shared memory block names are pickled.
+
+Shared memory blocks holding the computation inputs are created and owned by
+the GUI process. Results are also transported through shared memory on POSIX
+systems, where named blocks outlive the handles of the worker process. On
+Windows, a named block is destroyed as soon as its last handle is closed, so
+results are still pickled back.
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import os
+from collections.abc import Callable
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any
+
+import guidata.dataset as gds
+import numpy as np
+
+from cdl.core.gui.processor.catcher import CompOut, wng_err_func
+from cdl.core.model.base import BaseObj
+
+if TYPE_CHECKING:
+    from cdl.core.model.image import ImageObj
+    from cdl.core.model.signal import SignalObj
+
+#: Minimum array size (in bytes) for an array to be transported through shared
+#: memory (smaller arrays are simply pickled, which is faster)
+SHM_MIN_NBYTES = 1024**2
+
+#: True if computation results may be transported through shared memory (see
+#: module docstring)
+SHM_RESULTS = os.name != "nt"
+
+
+@dataclasses.dataclass
+class SharedArray:
+    """Handle to an array stored in a shared memory block
+
+    Attributes:
+        name: shared memory block name
+        shape: array shape
+        dtype: array data type (string representation)
+    """
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclasses.dataclass
+class SharedObject:
+    """Signal or image object whose data arrays are stored in shared memory
+
+    Attributes:
+        obj: object without its data arrays
+        arrays: shared arrays (keys: data item names, values: array handles)
+    """
+
+    obj: SignalObj | ImageObj
+    arrays: dict[str, SharedArray]
+
+
+def release_shared_memory(shms: list[SharedMemory], unlink: bool) -> None:
+    """Close shared memory blocks, and eventually destroy them.
+
+    Args:
+        shms: shared memory blocks
+        unlink: if True, destroy the blocks (this must be done by the owner)
+    """
+    for shm in shms:
+        try:
+            shm.close()
+        except BufferError:
+            # An array is still referencing the block: memory will be released
+            # when this array is garbage collected
+            pass
+        if unlink:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def export_object(
+    obj: SignalObj | ImageObj,
+) -> tuple[SignalObj | ImageObj | SharedObject, list[SharedMemory]]:
+    """Copy object's large data arrays to shared memory blocks.
+
+    Args:
+        obj: signal or image object
+
+    Returns:
+        Tuple (shared object, shared memory blocks), or (original object, empty
+        list) if the object has no array large enough to be shared
+    """
+    arrays: dict[str, SharedArray] = {}
+    shms: list[SharedMemory] = []
+    for item in obj.get_items():
+        if not isinstance(item, gds.FloatArrayItem):
+            continue
+        name = item.get_name()
+        data = getattr(obj, name)
+        if (
+            not isinstance(data, np.ndarray)
+            or data.dtype.hasobject
+            or data.nbytes < SHM_MIN_NBYTES
+        ):
+            continue
+        shm = SharedMemory(create=True, size=data.nbytes)
+        np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[...] = data
+        arrays[name] = SharedArray(shm.name, data.shape, data.dtype.str)
+        shms.append(shm)
+    if not arrays:
+        return obj, []
+    # Shallow copy: the original object must not be modified, but there is no need
+    # to copy anything else than the data arrays (the copy is pickled right away)
+    shared_obj = copy.copy(obj)
+    for name in arrays:
+        setattr(shared_obj, name, None)
+    return SharedObject(shared_obj, arrays), shms
+
+
+def import_object(
+    shared_obj: SharedObject, copy_data: bool
+) -> tuple[SignalObj | ImageObj, list[SharedMemory]]:
+    """Rebuild object from shared memory blocks.
+
+    Args:
+        shared_obj: shared object
+        copy_data: if True, data arrays are copied from shared memory (the blocks
+         may then be released right away), otherwise data arrays are views on
+         shared memory (the blocks must be kept alive as long as the object is used)
+
+    Returns:
+        Tuple (object, shared memory blocks)
+    """
+    obj = shared_obj.obj
+    shms: list[SharedMemory] = []
+    for name, array in shared_obj.arrays.items():
+        shm = SharedMemory(name=array.name)
+        data = np.ndarray(array.shape, dtype=np.dtype(array.dtype), buffer=shm.buf)
+        if copy_data:
+            data = data.copy()
+        setattr(obj, name, data)
+        shms.append(shm)
+    return obj, shms
+
+
+def export_args(args: tuple[Any]) -> tuple[tuple[Any], list[SharedMemory]]:
+    """Export computation arguments (GUI process side): objects with large
+    data arrays (including objects in lists of objects) are replaced by shared
+    objects.
+
+    Args:
+        args: computation arguments
+
+    Returns:
+        Tuple (exported arguments, shared memory blocks to be released by the
+        caller once the computation is done)
+    """
+    exported, shms = [], []
+    for arg in args:
+        if isinstance(arg, BaseObj):
+            arg, arg_shms = export_object(arg)
+            shms.extend(arg_shms)
+        elif isinstance(arg, list) and arg and isinstance(arg[0], BaseObj):
+            arg_list = []
+            for obj in arg:
+                obj, arg_shms = export_object(obj)
+                shms.extend(arg_shms)
+                arg_list.append(obj)
+            arg = arg_list
+        exported.append(arg)
+    return tuple(exported), shms
+
+
+def import_result(compout: CompOut) -> CompOut:
+    """Import computation output (GUI process side): if the result has been
+    transported through shared memory, copy it and destroy the shared memory blocks.
+
+    Args:
+        compout: computation output, as returned by :py:func:`shm_wng_err_func`
+
+    Returns:
+        Computation output
+    """
+    if isinstance(compout.result, SharedObject):
+        compout.result, shms = import_object(compout.result, copy_data=True)
+        release_shared_memory(shms, unlink=True)
+    return compout
+
+
+def shm_wng_err_func(func: Callable, args: tuple[Any]) -> CompOut:
+    """Wrapper function to run a computation in a worker process, with arguments
+    and result transported through shared memory (see :py:func:`export_args`
+    and :py:func:`import_result`), and errors and warnings caught by
+    :py:func:`cdl.core.gui.processor.catcher.wng_err_func`.
+
+    Args:
+        func: function to call
+        args: function arguments (exported)
+
+    Returns:
+        Computation output
+    """
+    in_shms: list[SharedMemory] = []
+    imported = []
+    for arg in args:
+        if isinstance(arg, SharedObject):
+            # Data arrays are views on shared memory: no copy at all
+            arg, arg_shms = import_object(arg, copy_data=False)
+            in_shms.extend(arg_shms)
+        elif isinstance(arg, list):
+            arg_list = []
+            for obj in arg:
+                if isinstance(obj, SharedObject):
+                    obj, arg_shms = import_object(obj, copy_data=False)
+                    in_shms.extend(arg_shms)
+                arg_list.append(obj)
+            arg = arg_list
+        imported.append(arg)
+    try:
+        compout = wng_err_func(func, tuple(imported))
+        if SHM_RESULTS and isinstance(compout.result, BaseObj):
+            compout.result, out_shms = export_object(compout.result)
+            # The GUI process is in charge of destroying the blocks
+            release_shared_memory(out_shms, unlink=False)
+    finally:
+        # Release references to input shared arrays before closing the blocks
+        del imported, args
+        arg = obj = arg_list = None
+        release_shared_memory(in_shms, unlink=False)
+    return compout
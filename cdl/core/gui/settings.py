@@ -39,6 +39,14 @@ class MainSettings(gds.DataSet):
             "<br>which prevents the application from freezing during long computations."
         ),
     )
+    process_pool_size = gds.IntItem(
+        _("Worker processes"),
+        min=0,
+        help=_(
+            "Number of processes used to run computations when process isolation"
+            "<br>is enabled (0: one process per CPU core)"
+        ),
+    )
     rpc_server_enabled = gds.BoolItem(
         "",
         _("RPC server"),
@@ -232,6 +240,7 @@ def datasets_to_conf(paramdict: dict[str, gds.DataSet]) -> None:
 
 RESTART_OPTIONS = (
     ("process_isolation_enabled", _("Process isolation enable status")),
+    ("process_pool_size", _("Number of worker processes")),
     ("rpc_server_enabled", _("RPC server enable status")),
     ("console_enabled", _("Console enable status")),
     ("plugins_enabled", _("Third-party plugins support")),
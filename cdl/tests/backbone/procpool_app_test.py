@@ -0,0 +1,47 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Process pool application test
+-----------------------------
+
+Testing that computations on many selected objects are distributed over the
+worker processes of the pool, and that results are added in the selection order.
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+import numpy as np
+
+import cdl.computation.image as cpi
+import cdl.obj
+import cdl.param
+from cdl.config import Conf
+from cdl.tests import cdltest_app_context
+from cdl.tests.data import create_noisygauss_image
+
+
+def test_process_pool():
+    """Run process pool application test"""
+    assert Conf.main.process_isolation_enabled.get(), "Process isolation required"
+    with cdltest_app_context() as win:
+        panel = win.imagepanel
+        newparam = cdl.obj.new_image_param(height=512, width=512)
+        for index in range(6):
+            obj = create_noisygauss_image(newparam)
+            obj.title = f"Image {index}"
+            panel.add_object(obj)
+        src_objs = panel.objmodel.get_all_objects()
+        panel.objview.select_objects(range(1, len(src_objs) + 1))
+        param = cdl.param.GaussianParam.create(sigma=2.0)
+        panel.processor.compute_gaussian_filter(param)
+        new_objs = panel.objmodel.get_all_objects()[len(src_objs) :]
+        assert len(new_objs) == len(src_objs)
+        for src_obj, new_obj in zip(src_objs, new_objs):
+            assert src_obj.short_id in new_obj.title
+            exp_obj = cpi.compute_gaussian_filter(src_obj, param)
+            assert np.array_equal(new_obj.data, exp_obj.data)
+
+
+if __name__ == "__main__":
+    test_process_pool()
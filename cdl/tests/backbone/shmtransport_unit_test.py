@@ -0,0 +1,86 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Shared memory transport unit test
+---------------------------------
+
+Testing that signal and image objects are correctly transported through shared
+memory (arguments and results of computations run with process isolation), and
+that shared memory blocks are destroyed once the computation is done.
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+import cdl.computation.image as cpi
+import cdl.computation.signal as cps
+import cdl.obj
+from cdl.core.gui.processor import transport
+from cdl.tests.data import create_noisygauss_image, create_periodic_signal
+
+
+def __check_transport(func, obj, ref_attr: str) -> None:
+    """Run computation through the shared memory transport and check the result"""
+    args, shms = transport.export_args((obj,))
+    assert len(shms) == 1
+    assert isinstance(args[0], transport.SharedObject)
+    assert getattr(args[0].obj, ref_attr) is None
+    # The original object must not be modified
+    assert getattr(obj, ref_attr) is not None
+    compout = transport.shm_wng_err_func(func, args)
+    transport.release_shared_memory(shms, unlink=True)
+    compout = transport.import_result(compout)
+    assert compout.error_msg is None
+    exp_obj = func(obj)
+    assert np.array_equal(getattr(compout.result, ref_attr), getattr(exp_obj, ref_attr))
+    assert compout.result.title == exp_obj.title
+    for shm in shms:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=shm.name)
+
+
+def test_shm_transport_image() -> None:
+    """Test shared memory transport of image objects"""
+    param = cdl.obj.new_image_param(height=1024, width=1024)
+    ima = create_noisygauss_image(param)
+    __check_transport(cpi.compute_abs, ima, "data")
+
+
+def test_shm_transport_signal() -> None:
+    """Test shared memory transport of signal objects"""
+    sig = create_periodic_signal(cdl.obj.SignalTypes.COSINUS, size=200000)
+    __check_transport(cps.compute_abs, sig, "xydata")
+
+
+def test_shm_transport_object_list() -> None:
+    """Test shared memory transport of lists of objects (N→1 reductions)"""
+    param = cdl.obj.new_image_param(height=1024, width=1024)
+    images = [create_noisygauss_image(param) for _index in range(3)]
+    dst = images[0].copy(dtype=float)
+    args, shms = transport.export_args((dst, images[1:]))
+    assert len(shms) == 3
+    assert all(isinstance(obj, transport.SharedObject) for obj in args[1])
+    compout = transport.shm_wng_err_func(cpi.compute_addition_n1, args)
+    transport.release_shared_memory(shms, unlink=True)
+    compout = transport.import_result(compout)
+    assert compout.error_msg is None
+    exp = sum(ima.data.astype(float) for ima in images)
+    assert np.allclose(compout.result.data, exp)
+
+
+def test_shm_transport_small_object() -> None:
+    """Test that small objects are not transported through shared memory"""
+    sig = create_periodic_signal(cdl.obj.SignalTypes.COSINUS, size=100)
+    args, shms = transport.export_args((sig,))
+    assert not shms and args[0] is sig
+
+
+if __name__ == "__main__":
+    test_shm_transport_image()
+    test_shm_transport_signal()
+    test_shm_transport_object_list()
+    test_shm_transport_small_object()
@@ -0,0 +1,57 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Object copy unit test
+---------------------
+
+Testing signal/image object copy, with or without data (metadata-only copy, as
+used to create the result objects of most computation functions).
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+import numpy as np
+
+import cdl.obj
+from cdl.computation.base import dst_11, dst_n1n
+from cdl.tests.data import create_noisygauss_image, create_paracetamol_signal
+
+
+def __check_copy(obj: cdl.obj.SignalObj | cdl.obj.ImageObj, data_name: str) -> None:
+    """Check object copy with and without data"""
+    obj.metadata["test_key"] = [1, 2, 3]
+    copy = obj.copy()
+    assert np.array_equal(getattr(copy, data_name), getattr(obj, data_name))
+    assert getattr(copy, data_name) is not getattr(obj, data_name)
+    mcopy = obj.copy(title="metadata only", copy_data=False)
+    assert getattr(mcopy, data_name) is None
+    assert mcopy.title == "metadata only"
+    assert mcopy.metadata["test_key"] == obj.metadata["test_key"]
+    assert mcopy.metadata["test_key"] is not obj.metadata["test_key"]
+    for dst in (
+        dst_11(obj, "func", copy_data=False),
+        dst_n1n(obj, obj, "func", copy_data=False),
+    ):
+        assert getattr(dst, data_name) is None
+        assert dst.title.startswith("func(")
+
+
+def test_signal_copy() -> None:
+    """Signal copy test"""
+    sig = create_paracetamol_signal()
+    __check_copy(sig, "xydata")
+    assert sig.copy(copy_data=False).xunit == sig.xunit
+
+
+def test_image_copy() -> None:
+    """Image copy test"""
+    ima = create_noisygauss_image()
+    ima.x0, ima.dx = 10.0, 0.5
+    __check_copy(ima, "data")
+    mcopy = ima.copy(copy_data=False)
+    assert (mcopy.x0, mcopy.dx) == (ima.x0, ima.dx)
+
+
+if __name__ == "__main__":
+    test_signal_copy()
+    test_image_copy()
@@ -64,6 +64,18 @@ def test_image_addition() -> None:
         check_array_result("Image addition", ima2.data, exp)
 
 
+@pytest.mark.validation
+def test_image_addition_n1() -> None:
+    """Image N→1 addition test (reduction in a single call)."""
+    execenv.print("*** Testing image N→1 addition:")
+    for ima1, ima2 in __iterate_image_couples():
+        dtype1, dtype2 = ima1.data.dtype, ima2.data.dtype
+        execenv.print(f"  {dtype2} + {dtype1} + {dtype1}: ", end="")
+        exp = ima2.data.astype(float) + 2 * ima1.data.astype(float)
+        res = cpi.compute_addition_n1(ima2.copy(dtype=float), [ima1, ima1])
+        check_array_result("Image N→1 addition", res.data, exp)
+
+
 @pytest.mark.validation
 def test_image_difference() -> None:
     """Image difference test."""
@@ -100,6 +112,18 @@ def test_image_product() -> None:
         check_array_result("Image multiplication", ima2.data, exp)
 
 
+@pytest.mark.validation
+def test_image_product_n1() -> None:
+    """Image N→1 multiplication test (reduction in a single call)."""
+    execenv.print("*** Testing image N→1 multiplication:")
+    for ima1, ima2 in __iterate_image_couples():
+        dtype1, dtype2 = ima1.data.dtype, ima2.data.dtype
+        execenv.print(f"  {dtype2} * {dtype1} * {dtype1}: ", end="")
+        exp = ima2.data.astype(float) * ima1.data.astype(float) ** 2
+        res = cpi.compute_product_n1(ima2.copy(dtype=float), [ima1, ima1])
+        check_array_result("Image N→1 multiplication", res.data, exp)
+
+
 @pytest.mark.validation
 def test_image_division() -> None:
     """Image division test."""
@@ -59,6 +59,26 @@ def test_signal_product() -> None:
     check_array_result("Signal multiplication", res, exp)
 
 
+@pytest.mark.validation
+def test_signal_addition_n1() -> None:
+    """Signal N→1 addition test (reduction in a single call)."""
+    s1, s2 = __create_two_signals()
+    s3 = s1.copy()
+    exp = s1.y + s2.y + s3.y
+    cps.compute_addition_n1(s1, [s2, s3])
+    check_array_result("Signal N→1 addition", s1.y, exp)
+
+
+@pytest.mark.validation
+def test_signal_product_n1() -> None:
+    """Signal N→1 multiplication test (reduction in a single call)."""
+    s1, s2 = __create_two_signals()
+    s3 = s1.copy()
+    exp = s1.y * s2.y * s3.y
+    cps.compute_product_n1(s1, [s2, s3])
+    check_array_result("Signal N→1 multiplication", s1.y, exp)
+
+
 @pytest.mark.validation
 def test_signal_difference() -> None:
     """Signal difference test."""